@@ -0,0 +1,68 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional Cython accelerator for the pgoutput decode hot path.
+
+Compiles the per-column TupleData walk from decoders.read_tuple_data into C,
+removing the interpreter dispatch that dominates Insert/Update/Delete
+throughput. The module is not built automatically (the source has no build
+step); compile it in place with
+
+    cythonize -i pg_replication/_decoders.pyx
+
+`decoders` picks it up when importable and falls back to the pure-Python
+implementation otherwise, so the extension is a strict opt-in.
+"""
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+
+# result classes injected by decoders at import time to avoid a circular import
+cdef object ColumnData = None
+cdef object TupleData = None
+
+
+def init_types(column_data, tuple_data):
+    """Registers the ColumnData/TupleData classes used to build results."""
+    global ColumnData, TupleData
+    ColumnData = column_data
+    TupleData = tuple_data
+
+
+def parse_tuple_data(bytes buf, Py_ssize_t pos):
+    """Parses a TupleData submessage starting at `pos`.
+
+    Returns a (TupleData, new_pos) pair; layout and result match
+    decoders.PgoutputMessage.read_tuple_data.
+    """
+    cdef const unsigned char* p = <const unsigned char*> PyBytes_AS_STRING(buf)
+    cdef Py_ssize_t size = PyBytes_GET_SIZE(buf)
+    cdef int n_columns, col_data_length
+    cdef unsigned char cat
+    cdef Py_ssize_t column
+
+    if pos + 2 > size:
+        raise ValueError("buffer too short for TupleData column count")
+    n_columns = (p[pos] << 8) | p[pos + 1]
+    pos += 2
+
+    column_data = [None] * n_columns
+    for column in range(n_columns):
+        if pos >= size:
+            raise ValueError("buffer too short for TupleData column")
+        cat = p[pos]
+        pos += 1
+        if cat == 0x74:  # 't' = text formatted value
+            if pos + 4 > size:
+                raise ValueError("buffer too short for TupleData column length")
+            col_data_length = (
+                (p[pos] << 24) | (p[pos + 1] << 16) | (p[pos + 2] << 8) | p[pos + 3]
+            )
+            pos += 4
+            if pos + col_data_length > size:
+                raise ValueError("buffer too short for TupleData column value")
+            # values decode lazily via ColumnData.col_data; only record layout
+            column_data[column] = ColumnData("t", col_data_length, buf, pos)
+            pos += col_data_length
+        elif cat == 0x6E:  # 'n' = NULL value
+            column_data[column] = ColumnData("n")
+        elif cat == 0x75:  # 'u' = unchanged TOASTed value
+            column_data[column] = ColumnData("u")
+    return TupleData(n_columns, column_data), pos
@@ -0,0 +1,80 @@
+"""Optional Numba accelerator for the pgoutput tuple-data scan.
+
+JIT-compiles the per-column walk over a NumPy uint8 view of the message
+buffer, so category bytes and value lengths are parsed at native speed;
+string materialization stays in Python. Used by `decoders` only when numba
+is importable and the Cython extension (_decoders) is not — neither numba
+nor numpy is a dependency of this source.
+"""
+
+import numpy as np
+from numba import njit
+
+# result classes injected by decoders at import time to avoid a circular import
+ColumnData = None
+TupleData = None
+
+
+def init_types(column_data, tuple_data):
+    """Registers the ColumnData/TupleData classes used to build results."""
+    global ColumnData, TupleData
+    ColumnData = column_data
+    TupleData = tuple_data
+
+
+@njit(cache=True)
+def _scan_tuple_data(buf_u8, pos):  # pragma: no cover - compiled
+    """Walks a TupleData submessage and returns per-column layout arrays.
+
+    Returns (categories, lengths, offsets, new_pos); lengths/offsets are only
+    meaningful for text-formatted ('t') columns.
+    """
+    n_columns = (int(buf_u8[pos]) << 8) | int(buf_u8[pos + 1])
+    pos += 2
+    categories = np.empty(n_columns, np.uint8)
+    lengths = np.empty(n_columns, np.int64)
+    offsets = np.empty(n_columns, np.int64)
+    for column in range(n_columns):
+        cat = buf_u8[pos]
+        pos += 1
+        categories[column] = cat
+        if cat == 0x74:  # 't' = text formatted value
+            length = (
+                (int(buf_u8[pos]) << 24)
+                | (int(buf_u8[pos + 1]) << 16)
+                | (int(buf_u8[pos + 2]) << 8)
+                | int(buf_u8[pos + 3])
+            )
+            pos += 4
+            offsets[column] = pos
+            lengths[column] = length
+            pos += length
+        else:
+            offsets[column] = 0
+            lengths[column] = 0
+    return categories, lengths, offsets, pos
+
+
+def parse_tuple_data(buf, pos):
+    """Parses a TupleData submessage starting at `pos`.
+
+    Returns a (TupleData, new_pos) pair; layout and result match
+    decoders.PgoutputMessage.read_tuple_data.
+    """
+    categories, lengths, offsets, new_pos = _scan_tuple_data(
+        np.frombuffer(buf, dtype=np.uint8), pos
+    )
+    n_columns = len(categories)
+    column_data = [None] * n_columns
+    for column in range(n_columns):
+        cat = categories[column]
+        if cat == 0x74:  # 't'
+            # values decode lazily via ColumnData.col_data; only record layout
+            column_data[column] = ColumnData(
+                "t", int(lengths[column]), buf, int(offsets[column])
+            )
+        elif cat == 0x6E:  # 'n' = NULL value
+            column_data[column] = ColumnData("n")
+        elif cat == 0x75:  # 'u' = unchanged TOASTed value
+            column_data[column] = ColumnData("u")
+    return TupleData(n_columns, column_data), new_pos
@@ -2,43 +2,111 @@
 # file copied from https://raw.githubusercontent.com/dgea005/pypgoutput/master/src/pypgoutput/decoders.py
 # we do this instead of importing `pypgoutput` because it depends on `psycopg2`, which causes errors when installing on macOS
 
-import io
-from abc import ABC, abstractmethod
+import struct
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from typing import List, NamedTuple, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-# integer byte lengths
-INT8 = 1
-INT16 = 2
-INT32 = 4
-INT64 = 8
+# pre-compiled big-endian (network order) readers for the fixed-width fields
+_S8 = struct.Struct("!b")
+_S16 = struct.Struct("!h")
+_S32 = struct.Struct("!i")
+_S64 = struct.Struct("!q")
 
+# fused fixed-width headers, unpacked in a single C call per message
+_BEGIN_HDR = struct.Struct("!qqq")  # lsn, commit_ts_us, tx_xid
+_COMMIT_HDR = struct.Struct("!bqqq")  # flags, lsn_commit, lsn, commit_ts_us
+_INSERT_HDR = struct.Struct("!ic")  # relation_id, new tuple byte
+_DELETE_HDR = struct.Struct("!iB")  # relation_id, message type byte
+
+# single-byte discriminators compared as ints to avoid a decode per column
+_CAT_N = ord("n")  # NULL value
+_CAT_U = ord("u")  # unchanged TOASTed value
+_CAT_T = ord("t")  # text formatted value
+_ORD_K = ord("K")
+_ORD_O = ord("O")
+_ORD_N = ord("N")
+
+# fused (category byte, value length) pair for text-formatted columns
+_COL_HDR = struct.Struct("!ci")
+
+# fused (type OID, atttypmod) suffix after each Relation column name
+_RELCOL_TYPES = struct.Struct("!ii")
+
+
+@lru_cache(maxsize=64)
+def _relation_ids_struct(n: int) -> struct.Struct:
+    # truncate counts repeat across messages, so the compiled formats are cached
+    return struct.Struct(f"!{n}i")
 
-def convert_pg_ts(_ts_in_microseconds: int) -> datetime:
-    ts = datetime(2000, 1, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
-    return ts + timedelta(microseconds=_ts_in_microseconds)
 
+# optional accelerator for the per-column hot loop: the Cython extension
+# (see _decoders.pyx for how to build it) or, failing that, the Numba-jitted
+# scan in _numba_decoders. Falls back to the pure-Python path otherwise.
+_parse_tuple_data_fast = None
 
-def convert_bytes_to_int(_in_bytes: bytes) -> int:
-    return int.from_bytes(_in_bytes, byteorder="big", signed=True)
+
+# postgres epoch, hoisted so convert_pg_ts does not rebuild it per call
+_PG_EPOCH = datetime(2000, 1, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def convert_pg_ts(_ts_in_microseconds: int) -> datetime:
+    return _PG_EPOCH + timedelta(microseconds=_ts_in_microseconds)
 
 
 def convert_bytes_to_utf8(_in_bytes: Union[bytes, bytearray]) -> str:
     return (_in_bytes).decode("utf-8")
 
 
-class ColumnData(NamedTuple):
+def _decode_col(_in_bytes: bytes) -> str:
+    # bytes.isascii is a C-level flag check and the latin-1 codec is a straight
+    # byte copy; most text-format payloads (numerics, timestamps, ids) are
+    # pure ASCII, so this skips the utf-8 state machine for the common case
+    if _in_bytes.isascii():
+        return _in_bytes.decode("latin-1")
+    return _in_bytes.decode("utf-8")
+
+
+# slots avoid a per-instance __dict__ and skip the namedtuple construction
+# machinery; these are created once per column/tuple in the hot decode loop
+class ColumnData:
+    """Single column of a TupleData submessage.
+
+    Text-formatted values are stored as an (offset, length) into the original
+    message buffer and `col_data` decodes lazily on access, so columns a
+    consumer filters out (e.g. via include_columns) never pay for decoding.
+    """
+
     # col_data_category is NOT the type. it means null value/toasted(not sent)/text formatted
-    col_data_category: Optional[str]
-    col_data_length: Optional[int] = None
-    col_data: Optional[str] = None
+    __slots__ = ("col_data_category", "col_data_length", "_buf", "_offset")
+
+    def __init__(
+        self,
+        col_data_category: Optional[str],
+        col_data_length: Optional[int] = None,
+        buf: Optional[bytes] = None,
+        offset: int = 0,
+    ) -> None:
+        self.col_data_category = col_data_category
+        self.col_data_length = col_data_length
+        self._buf = buf
+        self._offset = offset
+
+    @property
+    def col_data(self) -> Optional[str]:
+        if self._buf is None:
+            return None
+        return _decode_col(
+            self._buf[self._offset : self._offset + self.col_data_length]
+        )
 
     def __repr__(self) -> str:
         return f"[col_data_category='{self.col_data_category}', col_data_length={self.col_data_length}, col_data='{self.col_data}']"
 
 
-class ColumnType(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class ColumnType:
     """https://www.postgresql.org/docs/12/catalog-pg-attribute.html"""
 
     part_of_pkey: int
@@ -47,7 +115,8 @@ class ColumnType(NamedTuple):
     atttypmod: int
 
 
-class TupleData(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class TupleData:
     n_columns: int
     column_data: List[ColumnData]
 
@@ -55,48 +124,127 @@ class TupleData(NamedTuple):
         return f"n_columns: {self.n_columns}, data: {self.column_data}"
 
 
+try:
+    from . import _decoders as _accel
+except ImportError:  # extension not compiled; try the Numba tier
+    try:
+        from . import _numba_decoders as _accel  # type: ignore[no-redef]
+    except ImportError:  # numba/numpy not installed; stay pure-Python
+        _accel = None  # type: ignore[assignment]
+if _accel is not None:
+    _accel.init_types(ColumnData, TupleData)
+    _parse_tuple_data_fast = _accel.parse_tuple_data
+
+
+# tuple decoders specialized per relation_id, registered when the Relation
+# message arrives; the generated code unrolls the per-column loop for the
+# relation's known column count
+_SPECIALIZED: Dict[int, Callable[[bytes, int], Tuple[Optional[TupleData], int]]] = {}
+
+
+def _emit_tuple_decoder_src(n: int) -> str:
+    lines = [
+        "def decode(buf, pos):",
+        "    n_columns = (buf[pos] << 8) | buf[pos + 1]",
+        f"    if n_columns != {n}:",
+        "        return None, pos  # schema drift; caller falls back",
+        "    pos += 2",
+    ]
+    names = []
+    for i in range(n):
+        name = f"c{i}"
+        names.append(name)
+        lines += [
+            "    cat = buf[pos]",
+            "    pos += 1",
+            "    if cat == 116:  # 't'",
+            "        (length,) = _S32.unpack_from(buf, pos)",
+            "        pos += 4",
+            f"        {name} = ColumnData('t', length, buf, pos)",
+            "        pos += length",
+            "    elif cat == 110:  # 'n'",
+            f"        {name} = ColumnData('n')",
+            "    elif cat == 117:  # 'u'",
+            f"        {name} = ColumnData('u')",
+            "    else:",
+            f"        {name} = None",
+        ]
+    lines.append(f"    return TupleData({n}, [{', '.join(names)}]), pos")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _specialized_tuple_decoder(
+    n: int,
+) -> Callable[[bytes, int], Tuple[Optional[TupleData], int]]:
+    # cached per column count; relations sharing a width share the decoder
+    namespace = {"_S32": _S32, "ColumnData": ColumnData, "TupleData": TupleData}
+    exec(_emit_tuple_decoder_src(n), namespace)
+    return namespace["decode"]  # type: ignore[return-value]
+
+
 # TODO: you can make decoding way faster by
 # - moving all the decoding core to PgoutputMessage
-# - use struct unpack and increase offset manually to reduce calls
 # - use tuples to represent data, separate data from decoding!
-class PgoutputMessage(ABC):
-    def __init__(self, buffer: bytes):
-        self.buffer: io.BytesIO = io.BytesIO(buffer)
-        self.byte1: str = self.read_utf8(1)
+# not an ABC: ABCMeta.__call__ adds a measurable per-instantiation cost and
+# every subclass implements both methods anyway
+class PgoutputMessage:
+    __slots__ = ("buf", "pos", "byte1")
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview]):
+        if not isinstance(buffer, bytes):
+            # psycopg2 can hand us a memoryview/bytearray payload; normalize
+            # once so every field read below is a view into one immutable
+            # buffer instead of a per-read copy
+            buffer = bytes(buffer)
+        self.buf: bytes = buffer
+        self.pos: int = 1
+        self.byte1: str = buffer[0:1].decode("utf-8")
         self.decode_buffer()
 
-    @abstractmethod
     def decode_buffer(self) -> None:
         """Decoding is implemented for each message type"""
+        raise NotImplementedError
 
-    @abstractmethod
     def __repr__(self) -> str:
         """Implemented for each message type"""
+        raise NotImplementedError
 
     def read_int8(self) -> int:
-        return convert_bytes_to_int(self.buffer.read(INT8))
+        (v,) = _S8.unpack_from(self.buf, self.pos)
+        self.pos += 1
+        return v
 
     def read_int16(self) -> int:
-        return convert_bytes_to_int(self.buffer.read(INT16))
+        (v,) = _S16.unpack_from(self.buf, self.pos)
+        self.pos += 2
+        return v
 
     def read_int32(self) -> int:
-        return convert_bytes_to_int(self.buffer.read(INT32))
+        (v,) = _S32.unpack_from(self.buf, self.pos)
+        self.pos += 4
+        return v
 
     def read_int64(self) -> int:
-        return convert_bytes_to_int(self.buffer.read(INT64))
+        (v,) = _S64.unpack_from(self.buf, self.pos)
+        self.pos += 8
+        return v
 
     def read_utf8(self, n: int = 1) -> str:
-        return convert_bytes_to_utf8(self.buffer.read(n))
+        v = self.buf[self.pos : self.pos + n].decode("utf-8")
+        self.pos += n
+        return v
 
     def read_timestamp(self) -> datetime:
         # 8 chars -> int64 -> timestamp
         return convert_pg_ts(_ts_in_microseconds=self.read_int64())
 
     def read_string(self) -> str:
-        output = bytearray()
-        while (next_char := self.buffer.read(1)) != b"\x00":
-            output += next_char
-        return convert_bytes_to_utf8(output)
+        # bytes.index drops into C-level memchr; raises ValueError if unterminated
+        end = self.buf.index(0, self.pos)
+        value = self.buf[self.pos : end].decode("utf-8")
+        self.pos = end + 1  # consume the NUL terminator
+        return value
 
     def read_tuple_data(self) -> TupleData:
         """
@@ -112,26 +260,55 @@ class PgoutputMessage(ABC):
                 Byten The value of the column, in text format. (A future release might support additional formats.) n is the above length.
         """
         # TODO: investigate what happens with the generated columns
-        column_data = list()
+        if _parse_tuple_data_fast is not None:
+            tuple_data, self.pos = _parse_tuple_data_fast(self.buf, self.pos)
+            return tuple_data
         n_columns = self.read_int16()
+        # pre-sized so the loop assigns by index instead of growing via append
+        column_data: List[Optional[ColumnData]] = [None] * n_columns
+        buf = self.buf
+        pos = self.pos
+        # last position at which the fused (category, length) peek is in bounds;
+        # a trailing 'n'/'u' column can leave fewer than 5 bytes in the buffer
+        fused_limit = len(buf) - _COL_HDR.size
         for column in range(n_columns):
-            col_data_category = self.read_utf8()
-            if col_data_category in ("n", "u"):
-                # "n"=NULL, "t"=TOASTed
-                column_data.append(ColumnData(col_data_category=col_data_category))
-            elif col_data_category == "t":
+            if pos <= fused_limit:
+                cat, col_data_length = _COL_HDR.unpack_from(buf, pos)
+            else:
+                cat = buf[pos : pos + 1]
+                col_data_length = 0
+            if cat == b"t":
                 # t = tuple
-                col_data_length = self.read_int32()
-                col_data = self.read_utf8(col_data_length)
-                column_data.append(
-                    ColumnData(
-                        col_data_category=col_data_category,
-                        col_data_length=col_data_length,
-                        col_data=col_data,
-                    )
-                )
+                pos += _COL_HDR.size
+                column_data[column] = ColumnData("t", col_data_length, buf, pos)
+                pos += col_data_length
+            elif cat == b"n":
+                pos += 1
+                column_data[column] = ColumnData(col_data_category="n")
+            elif cat == b"u":
+                pos += 1
+                column_data[column] = ColumnData(col_data_category="u")
+            else:
+                pos += 1
+        self.pos = pos
         return TupleData(n_columns=n_columns, column_data=column_data)
 
+    def read_tuple_for(self, relation_id: int) -> TupleData:
+        """read_tuple_data through the decoder specialized for the relation.
+
+        Falls back to the generic loop when no Relation message has been seen
+        for the id or the wire column count no longer matches the registered
+        layout.
+        """
+        if _parse_tuple_data_fast is None:  # the compiled tiers are faster still
+            decoder = _SPECIALIZED.get(relation_id)
+            if decoder is not None:
+                tuple_data, pos = decoder(self.buf, self.pos)
+                if tuple_data is not None:
+                    self.pos = pos
+                    return tuple_data
+        return self.read_tuple_data()
+
 
 class Begin(PgoutputMessage):
     """
@@ -144,17 +321,27 @@ class Begin(PgoutputMessage):
     tx_xid Int32 Xid of the transaction.
     """
 
+    __slots__ = ("lsn", "commit_ts_us", "tx_xid", "_commit_ts")
+
     byte1: str
     lsn: int
-    commit_ts: datetime
+    commit_ts_us: int
     tx_xid: int
 
     def decode_buffer(self) -> None:
-        if self.byte1 != "B":
-            raise ValueError("first byte in buffer does not match Begin message")
-        self.lsn = self.read_int64()
-        self.commit_ts = self.read_timestamp()
-        self.tx_xid = self.read_int64()
+        self.lsn, self.commit_ts_us, self.tx_xid = _BEGIN_HDR.unpack_from(
+            self.buf, self.pos
+        )
+        self.pos += _BEGIN_HDR.size
+        self._commit_ts = None
+
+    @property
+    def commit_ts(self) -> datetime:
+        # materialized lazily; consumers that only track LSNs never pay for
+        # the datetime construction
+        if self._commit_ts is None:
+            self._commit_ts = convert_pg_ts(self.commit_ts_us)
+        return self._commit_ts
 
     def __repr__(self) -> str:
         return (
@@ -172,19 +359,29 @@ class Commit(PgoutputMessage):
     Int64 Commit timestamp of the transaction. The value is in number of microseconds since PostgreSQL epoch (2000-01-01).
     """
 
+    __slots__ = ("flags", "lsn_commit", "lsn", "commit_ts_us", "_commit_ts")
+
     byte1: str
     flags: int
     lsn_commit: int
     lsn: int
-    commit_ts: datetime
+    commit_ts_us: int
 
     def decode_buffer(self) -> None:
-        if self.byte1 != "C":
-            raise ValueError("first byte in buffer does not match Commit message")
-        self.flags = self.read_int8()
-        self.lsn_commit = self.read_int64()
-        self.lsn = self.read_int64()
-        self.commit_ts = self.read_timestamp()
+        (
+            self.flags,
+            self.lsn_commit,
+            self.lsn,
+            self.commit_ts_us,
+        ) = _COMMIT_HDR.unpack_from(self.buf, self.pos)
+        self.pos += _COMMIT_HDR.size
+        self._commit_ts = None
+
+    @property
+    def commit_ts(self) -> datetime:
+        if self._commit_ts is None:
+            self._commit_ts = convert_pg_ts(self.commit_ts_us)
+        return self._commit_ts
 
     def __repr__(self) -> str:
         return (
@@ -223,6 +420,15 @@ class Relation(PgoutputMessage):
         Int32 Type modifier of the column (atttypmod).
     """
 
+    __slots__ = (
+        "relation_id",
+        "namespace",
+        "relation_name",
+        "replica_identity_setting",
+        "n_columns",
+        "columns",
+    )
+
     byte1: str
     relation_id: int
     namespace: str
@@ -232,30 +438,36 @@ class Relation(PgoutputMessage):
     columns: List[ColumnType]
 
     def decode_buffer(self) -> None:
-        if self.byte1 != "R":
-            raise ValueError("first byte in buffer does not match Relation message")
         self.relation_id = self.read_int32()
         self.namespace = self.read_string()
         self.relation_name = self.read_string()
         self.replica_identity_setting = self.read_utf8()
         self.n_columns = self.read_int16()
-        self.columns = list()
+        self.columns = [None] * self.n_columns  # type: ignore[list-item]
 
+        buf = self.buf
+        pos = self.pos
         for column in range(self.n_columns):
-            part_of_pkey = self.read_int8()
-            col_name = self.read_string()
-            data_type_id = self.read_int32()
+            # pkey flag byte, NUL-terminated name, then a fixed (type OID,
+            # atttypmod) suffix unpacked in one call
+            part_of_pkey = buf[pos]
+            pos += 1
+            end = buf.index(0, pos)
+            col_name = buf[pos:end].decode("utf-8")
             # TODO: check on use of signed / unsigned
             # check with select oid from pg_type where typname = <type>; timestamp == 1184, int4 = 23
-            col_modifier = self.read_int32()
-            self.columns.append(
-                ColumnType(
-                    part_of_pkey=part_of_pkey,
-                    name=col_name,
-                    type_id=data_type_id,
-                    atttypmod=col_modifier,
-                )
+            data_type_id, col_modifier = _RELCOL_TYPES.unpack_from(buf, end + 1)
+            pos = end + 1 + _RELCOL_TYPES.size
+            self.columns[column] = ColumnType(
+                part_of_pkey=part_of_pkey,
+                name=col_name,
+                type_id=data_type_id,
+                atttypmod=col_modifier,
             )
+        self.pos = pos
+        # steady state: subsequent Insert/Update/Delete tuples for this
+        # relation decode through code unrolled for its column count
+        _SPECIALIZED[self.relation_id] = _specialized_tuple_decoder(self.n_columns)
 
     def __repr__(self) -> str:
         return (
@@ -287,19 +499,18 @@ class Insert(PgoutputMessage):
     TupleData TupleData message part representing the contents of new tuple.
     """
 
+    __slots__ = ("relation_id", "new_tuple_byte", "new_tuple")
+
     byte1: str
     relation_id: int
     new_tuple_byte: str
     new_tuple: TupleData
 
     def decode_buffer(self) -> None:
-        if self.byte1 != "I":
-            raise ValueError(
-                f"first byte in buffer does not match Insert message (expected 'I', got '{self.byte1}'"
-            )
-        self.relation_id = self.read_int32()
-        self.new_tuple_byte = self.read_utf8()
-        self.new_tuple = self.read_tuple_data()
+        self.relation_id, new_tuple_byte = _INSERT_HDR.unpack_from(self.buf, self.pos)
+        self.pos += _INSERT_HDR.size
+        self.new_tuple_byte = new_tuple_byte.decode("utf-8")
+        self.new_tuple = self.read_tuple_for(self.relation_id)
 
     def __repr__(self) -> str:
         return (
@@ -321,42 +532,39 @@ class Update(PgoutputMessage):
     The Update message may contain either a 'K' message part or an 'O' message part or neither of them, but never both of them.
     """
 
+    __slots__ = ("relation_id", "optional_tuple_identifier", "old_tuple", "new_tuple")
+
     byte1: str
     relation_id: int
-    next_byte_identifier: Optional[str]
     optional_tuple_identifier: Optional[str]
     old_tuple: Optional[TupleData]
-    new_tuple_byte: str
     new_tuple: TupleData
 
     def decode_buffer(self) -> None:
         self.optional_tuple_identifier = None
         self.old_tuple = None
-        if self.byte1 != "U":
-            raise ValueError(
-                f"first byte in buffer does not match Update message (expected 'U', got '{self.byte1}'"
-            )
         self.relation_id = self.read_int32()
         # TODO test update to PK, test update with REPLICA IDENTITY = FULL
-        self.next_byte_identifier = self.read_utf8()  # one of K, O or N
-        if self.next_byte_identifier == "K" or self.next_byte_identifier == "O":
-            self.optional_tuple_identifier = self.next_byte_identifier
-            self.old_tuple = self.read_tuple_data()
-            self.new_tuple_byte = self.read_utf8()
-        else:
-            self.new_tuple_byte = self.next_byte_identifier
-        if self.new_tuple_byte != "N":
+        # common case: no K/O part, the first byte is already the 'N' tuple
+        next_byte = self.buf[self.pos]  # one of K, O or N
+        self.pos += 1
+        if next_byte == _ORD_K or next_byte == _ORD_O:
+            self.optional_tuple_identifier = chr(next_byte)
+            self.old_tuple = self.read_tuple_for(self.relation_id)
+            next_byte = self.buf[self.pos]
+            self.pos += 1
+        if next_byte != _ORD_N:
             # TODO: test exception handling
             raise ValueError(
-                f"did not find new_tuple_byte ('N') at position: {self.buffer.tell()}, found: '{self.new_tuple_byte}'"
+                f"did not find new_tuple_byte ('N') at position: {self.pos}, found: '{chr(next_byte)}'"
             )
-        self.new_tuple = self.read_tuple_data()
+        self.new_tuple = self.read_tuple_for(self.relation_id)
 
     def __repr__(self) -> str:
         return (
             f"UPDATE \n\tbyte1: '{self.byte1}', \n\trelation_id: {self.relation_id}"
             f"\n\toptional_tuple_identifier: '{self.optional_tuple_identifier}', \n\toptional_old_tuple_data: {self.old_tuple}"
-            f"\n\tnew_tuple_byte: '{self.new_tuple_byte}', \n\tnew_tuple: {self.new_tuple}"
+            f"\n\tnew_tuple: {self.new_tuple}"
         )
 
 
@@ -371,24 +579,23 @@ class Delete(PgoutputMessage):
     The Delete message may contain either a 'K' message part or an 'O' message part, but never both of them.
     """
 
+    __slots__ = ("relation_id", "message_type", "old_tuple")
+
     byte1: str
     relation_id: int
     message_type: str
     old_tuple: TupleData
 
     def decode_buffer(self) -> None:
-        if self.byte1 != "D":
-            raise ValueError(
-                f"first byte in buffer does not match Delete message (expected 'D', got '{self.byte1}'"
-            )
-        self.relation_id = self.read_int32()
-        self.message_type = self.read_utf8()
+        self.relation_id, message_type = _DELETE_HDR.unpack_from(self.buf, self.pos)
+        self.pos += _DELETE_HDR.size
         # TODO: test with replica identity full
-        if self.message_type not in ["K", "O"]:
+        if message_type != _ORD_K and message_type != _ORD_O:
             raise ValueError(
-                f"message type byte is not 'K' or 'O', got: '{self.message_type}'"
+                f"message type byte is not 'K' or 'O', got: '{chr(message_type)}'"
             )
-        self.old_tuple = self.read_tuple_data()
+        self.message_type = chr(message_type)
+        self.old_tuple = self.read_tuple_for(self.relation_id)
 
     def __repr__(self) -> str:
         return (
@@ -405,24 +612,46 @@ class Truncate(PgoutputMessage):
     Int32           ID of the relation corresponding to the ID in the relation message. This field is repeated for each relation.
     """
 
+    __slots__ = ("number_of_relations", "option_bits", "relation_ids")
+
     byte1: str
     number_of_relations: int
     option_bits: int
     relation_ids: List[int]
 
     def decode_buffer(self) -> None:
-        if self.byte1 != "T":
-            raise ValueError(
-                f"first byte in buffer does not match Truncate message (expected 'T', got '{self.byte1}'"
-            )
         self.number_of_relations = self.read_int32()
         self.option_bits = self.read_int8()
-        self.relation_ids = []
-        for relation in range(self.number_of_relations):
-            self.relation_ids.append(self.read_int32())
+        ids_struct = _relation_ids_struct(self.number_of_relations)
+        self.relation_ids = list(ids_struct.unpack_from(self.buf, self.pos))
+        self.pos += ids_struct.size
 
     def __repr__(self) -> str:
         return (
             f"TRUNCATE \n\tbyte1: {self.byte1} \n\tn_relations: {self.number_of_relations} "
             f"option_bits: {self.option_bits}, relation_ids: {self.relation_ids}"
         )
+
+
+# first-byte dispatch table; one dict lookup selects the right decoder for a
+# wire message instead of an if/elif chain in every consumer
+_MSG_TYPES = {
+    ord("B"): Begin,
+    ord("C"): Commit,
+    ord("R"): Relation,
+    ord("I"): Insert,
+    ord("U"): Update,
+    ord("D"): Delete,
+    ord("T"): Truncate,
+}
+
+
+def decode_message(buffer: Union[bytes, bytearray, memoryview]) -> PgoutputMessage:
+    """Decodes a replication message by dispatching on its first byte."""
+    try:
+        cls = _MSG_TYPES[buffer[0]]
+    except KeyError:
+        raise ValueError(
+            f"Unknown replication message type: {bytes(buffer[0:1])!r}"
+        ) from None
+    return cls(buffer)
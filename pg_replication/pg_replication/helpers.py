@@ -54,6 +54,7 @@ from .decoders import (
     Update,
     Delete,
     ColumnData,
+    decode_message,
 )
 
 __source_name__ = "pg_replication"
@@ -687,12 +688,8 @@ class MessageConsumer:
         - a table's schema has changed
         """
         op = msg.payload[0]
-        if op == 73:  # ASCII for 'I'
-            self.process_change(Insert(msg.payload), msg.data_start)
-        elif op == 85:  # ASCII for 'U'
-            self.process_change(Update(msg.payload), msg.data_start)
-        elif op == 68:  # ASCII for 'D'
-            self.process_change(Delete(msg.payload), msg.data_start)
+        if op in (73, 85, 68):  # ASCII for 'I', 'U', 'D'
+            self.process_change(decode_message(msg.payload), msg.data_start)  # type: ignore[arg-type]
         elif op == 66:  # ASCII for 'B'
             self.last_commit_ts = Begin(msg.payload).commit_ts  # type: ignore[assignment]
         elif op == 67:  # ASCII for 'C'